@@ -1,4 +1,5 @@
 const fs = require('fs');
+const { writeJSON, report } = require('./json-output.cjs');
 
 // Step 1: Merge all example translation chunks
 console.log("=== MERGING EXAMPLE TRANSLATIONS ===");
@@ -43,7 +44,7 @@ for (const lvl of levels) {
     }
   }
 
-  fs.writeFileSync(enFile, JSON.stringify(enData, null, 2));
+  writeJSON(enFile, enData);
   console.log(`${lvl.toUpperCase()}: ${fixed} exampleEn fixed, ${missing} missing`);
   totalFixed += fixed;
   totalMissing += missing;
@@ -69,3 +70,5 @@ for (const lvl of levels) {
 
   console.log(`${lvl.toUpperCase()}: ${total} words | en: ${goodEn}/${total} | it: ${goodIt}/${total} | exampleEn: ${goodExEn}/${total}`);
 }
+
+console.log(`\nJSON output: ${report()}`);
@@ -1,4 +1,5 @@
 const fs = require('fs');
+const { writeJSON, report } = require('./json-output.cjs');
 
 // Load word translations
 const enTrans = JSON.parse(fs.readFileSync('essential-en-translations.json', 'utf8'));
@@ -24,7 +25,7 @@ for (const lvl of levels) {
     }
   }
 
-  fs.writeFileSync(enFile, JSON.stringify(enData, null, 2));
+  writeJSON(enFile, enData);
   console.log(`${lvl.toUpperCase()}: fixed ${fixedEn} 'en' fields`);
   totalFixedEn += fixedEn;
 }
@@ -46,3 +47,5 @@ for (const lvl of levels) {
   }
 }
 console.log(`\nRemaining en=de: ${remaining}`);
+
+console.log(`\nJSON output: ${report()}`);
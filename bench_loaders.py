@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Load-waterfall benchmark for the data loaders on throttled networks.
+
+Starts a local HTTP server that serves public/data with a per-request round
+trip latency and a shared bandwidth limit, then replays the fetch pattern of
+each page and records the request waterfall and the time until the data is
+parsed. Every pattern runs in four variants:
+
+    current         the order the app uses today (dataLoader.js / DataContext.jsx)
+    parallel        every chunk requested at once, capped at --connections
+    current+gzip    current, with precompressed responses
+    parallel+gzip   parallel, with precompressed responses
+
+Usage: python3 bench_loaders.py [--profile 3g|4g|wifi] [--pattern vocabulary verbs ...]
+                                [--level A1] [--lang en] [--waterfall] [--json out.json]
+"""
+
+import argparse
+import gzip
+import http.server
+import json
+import math
+import os
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from json_output import report, write_json
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(ROOT, 'public', 'data')
+SLICE = 16 * 1024
+
+# name: (round trip latency in ms, bandwidth in kbit/s)
+PROFILES = {
+    '3g': (400, 400),
+    '4g': (150, 1600),
+    'wifi': (20, 10000),
+}
+LEVELS = ['a1', 'a2', 'b1', 'b2', 'c1', 'c2']
+
+
+# ------------------------------------------------------------
+# Throttled server
+# ------------------------------------------------------------
+class Link:
+    """A single FIFO pipe shared by every response, like a mobile link."""
+
+    def __init__(self, kbps):
+        self.bytes_per_sec = kbps * 1000 / 8
+        self.lock = threading.Lock()
+        self.free_at = 0.0
+
+    def send(self, nbytes):
+        with self.lock:
+            start = max(time.perf_counter(), self.free_at)
+            self.free_at = start + nbytes / self.bytes_per_sec
+            done = self.free_at
+        delay = done - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class ThrottledHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        rel = self.path.split('?', 1)[0].lstrip('/')
+        if rel.startswith('data/'):
+            rel = rel[len('data/'):]
+        path = os.path.normpath(os.path.join(DATA_DIR, rel))
+        if not path.startswith(DATA_DIR) or not os.path.isfile(path):
+            self.send_error(404)
+            return
+
+        body, encoding = server.body(path, 'gzip' in self.headers.get('Accept-Encoding', ''))
+        time.sleep(server.latency)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.end_headers()
+        for i in range(0, len(body), SLICE):
+            part = body[i:i + SLICE]
+            server.link.send(len(part))
+            self.wfile.write(part)
+
+    def log_message(self, *args):
+        pass
+
+
+class ThrottledServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, latency_ms, kbps):
+        super().__init__(('127.0.0.1', 0), ThrottledHandler)
+        self.latency = latency_ms / 1000
+        self.link = Link(kbps)
+        self.precompressed = False
+        self.gz_cache = {}
+
+    def body(self, path, accepts_gzip):
+        if self.precompressed and accepts_gzip and path in self.gz_cache:
+            return self.gz_cache[path], 'gzip'
+        with open(path, 'rb') as f:
+            return f.read(), None
+
+    def precompress(self):
+        """gzip every data file up front so no variant pays for compression inside a request."""
+        for dirpath, _dirs, files in os.walk(DATA_DIR):
+            for name in files:
+                path = os.path.join(dirpath, name)
+                if name.endswith('.json') and path not in self.gz_cache:
+                    with open(path, 'rb') as f:
+                        self.gz_cache[path] = gzip.compress(f.read(), 9)
+
+    def reset(self, precompressed):
+        if precompressed:
+            self.precompress()
+        self.precompressed = precompressed
+        self.link.free_at = 0.0
+
+
+# ------------------------------------------------------------
+# Client
+# ------------------------------------------------------------
+class Client:
+    def __init__(self, base_url, lang, connections):
+        self.base_url = base_url
+        self.prefix = f'{lang}/' if lang and lang != 'it' else ''
+        self.pool = ThreadPoolExecutor(max_workers=connections)
+        self.waterfall = []
+        self.pending = []
+        self.t0 = 0.0
+
+    def start(self):
+        self.waterfall = []
+        self.pending = []
+        self.t0 = time.perf_counter()
+
+    def wait(self):
+        """Wait for requests that were fired and never awaited."""
+        for future in self.pending:
+            future.result()
+
+    def _fetch(self, path):
+        start = time.perf_counter()
+        req = urllib.request.Request(f'{self.base_url}/data/{self.prefix}{path}',
+                                     headers={'Accept-Encoding': 'gzip'})
+        with urllib.request.urlopen(req) as resp:
+            ttfb = time.perf_counter()
+            raw = resp.read()
+            encoding = resp.headers.get('Content-Encoding')
+        text = gzip.decompress(raw) if encoding == 'gzip' else raw
+        data = json.loads(text)
+        end = time.perf_counter()
+        self.waterfall.append({
+            'path': path,
+            'start': (start - self.t0) * 1000,
+            'ttfb': (ttfb - self.t0) * 1000,
+            'end': (end - self.t0) * 1000,
+            'wireBytes': len(raw),
+            'bytes': len(text),
+        })
+        return data
+
+    def submit(self, path):
+        """Start a request; like calling fetchJSON without awaiting it."""
+        future = self.pool.submit(self._fetch, path)
+        self.pending.append(future)
+        return future
+
+    def get(self, path):
+        """Await a single request."""
+        return self.submit(path).result()
+
+    def get_all(self, paths):
+        """Promise.all over paths."""
+        return [f.result() for f in [self.submit(p) for p in paths]]
+
+
+# ------------------------------------------------------------
+# Page loading patterns
+# ------------------------------------------------------------
+def vocabulary_current(client, level):
+    # loadAllVocabModules: index, then each chunk awaited in turn
+    index = client.get(f'vocabulary/{level}/index.json')
+    for i in range(1, math.ceil(len(index) / 20) + 1):
+        client.get(f'vocabulary/{level}/modules_{i}.json')
+
+
+def vocabulary_parallel(client, level):
+    index = client.get(f'vocabulary/{level}/index.json')
+    client.get_all([f'vocabulary/{level}/modules_{i}.json' for i in range(1, math.ceil(len(index) / 20) + 1)])
+
+
+def verbs_current(client, level):
+    # loadAllVerbs: stats, then each chunk awaited in turn
+    stats = client.get('verbs/stats.json')
+    for i in range(1, math.ceil(stats.get('totalVerbs', 414) / 50) + 1):
+        client.get(f'verbs/verbs_{i}.json')
+
+
+def verbs_parallel(client, level):
+    stats = client.get('verbs/stats.json')
+    client.get_all([f'verbs/verbs_{i}.json' for i in range(1, math.ceil(stats.get('totalVerbs', 414) / 50) + 1)])
+
+
+def preload_current(client, level):
+    # preloadLevel fires both requests without awaiting them. fetchJSON only caches
+    # resolved data, so the page opening right after requests the index again.
+    client.submit(f'vocabulary/{level}/index.json')
+    client.submit(f'grammar/{level}.json')
+    vocabulary_current(client, level)
+
+
+def preload_parallel(client, level):
+    # In-flight requests shared with the page, chunks fetched together
+    index = client.submit(f'vocabulary/{level}/index.json')
+    client.submit(f'grammar/{level}.json')
+    count = math.ceil(len(index.result()) / 20)
+    client.get_all([f'vocabulary/{level}/modules_{i}.json' for i in range(1, count + 1)])
+
+
+def app_boot(client, level):
+    # DataContext.loadAll is already parallel, so both variants are the same
+    phase1 = [f'vocabulary/{lvl}/index.json' for lvl in LEVELS]
+    phase1 += ['vocabulary/stats.json', 'grammar/meta.json']
+    phase1 += [f'grammar/{lvl}.json' for lvl in LEVELS]
+    phase1 += ['verbs/stats.json', 'reading.json', 'lessons.json']
+    results = client.get_all(phase1)
+    chunks = []
+    for lvl, index in zip(LEVELS, results[:len(LEVELS)]):
+        chunks += [f'vocabulary/{lvl}/modules_{i}.json' for i in range(1, math.ceil(len(index) / 20) + 1)]
+    total_verbs = results[len(LEVELS) + 2 + len(LEVELS)].get('totalVerbs', 414)
+    chunks += [f'verbs/verbs_{i}.json' for i in range(1, math.ceil(total_verbs / 50) + 1)]
+    client.get_all(chunks)
+
+
+# pattern: (current, parallel)
+PATTERNS = {
+    'vocabulary': (vocabulary_current, vocabulary_parallel),
+    'verbs': (verbs_current, verbs_parallel),
+    'preload': (preload_current, preload_parallel),
+    'app-boot': (app_boot, app_boot),
+}
+DEFAULT_PATTERNS = ['vocabulary', 'verbs', 'preload']
+
+
+def print_waterfall(entries, width=60):
+    if not entries:
+        return
+    total = max(e['end'] for e in entries) or 1
+    scale = width / total
+    for e in sorted(entries, key=lambda e: e['start']):
+        lead = int(e['start'] * scale)
+        wait = max(int(e['ttfb'] * scale) - lead, 0)
+        recv = max(int(e['end'] * scale) - lead - wait, 1)
+        bar = ' ' * lead + '.' * wait + '#' * recv
+        print(f"    {e['path'][:28]:<28} {bar:<{width}} {e['end']:7.0f}ms")
+
+
+def run(args):
+    latency, kbps = PROFILES[args.profile]
+    if args.latency is not None:
+        latency = args.latency
+    if args.bandwidth is not None:
+        kbps = args.bandwidth
+
+    server = ThrottledServer(latency, kbps)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    client = Client(f'http://127.0.0.1:{server.server_address[1]}', args.lang, args.connections)
+    level = args.level.lower()
+
+    print(f"Profile {args.profile}: {latency} ms RTT, {kbps} kbit/s, {args.connections} connections, "
+          f"level {args.level}, lang {args.lang}")
+    results = []
+    try:
+        for pattern in args.pattern:
+            current, parallel = PATTERNS[pattern]
+            print(f"\n{pattern}")
+            for variant, fn, precompressed in [
+                ('current', current, False),
+                ('parallel', parallel, False),
+                ('current+gzip', current, True),
+                ('parallel+gzip', parallel, True),
+            ]:
+                server.reset(precompressed)
+                client.start()
+                fn(client, level)
+                client.wait()
+                entries = sorted(client.waterfall, key=lambda e: e['start'])
+                time_to_data = max(e['end'] for e in entries)
+                wire = sum(e['wireBytes'] for e in entries)
+                decoded = sum(e['bytes'] for e in entries)
+                print(f"  {variant:<14} {len(entries):3d} requests  {wire / 1024:8.1f} KB wire "
+                      f"({decoded / 1024:.1f} KB JSON)  time-to-data {time_to_data:8.0f} ms")
+                if args.waterfall:
+                    print_waterfall(entries)
+                results.append({
+                    'pattern': pattern, 'variant': variant, 'requests': len(entries),
+                    'wireBytes': wire, 'bytes': decoded, 'timeToData': time_to_data,
+                    'waterfall': entries,
+                })
+    finally:
+        server.shutdown()
+        client.pool.shutdown()
+
+    if args.json:
+        write_json(args.json, {'profile': args.profile, 'latency': latency, 'bandwidth': kbps,
+                               'connections': args.connections, 'results': results})
+        print(f"\nResults written to {args.json} ({report()})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load-waterfall benchmark for the data loaders")
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='4g')
+    parser.add_argument('--latency', type=int, default=None, help='round trip latency in ms (overrides profile)')
+    parser.add_argument('--bandwidth', type=int, default=None, help='bandwidth in kbit/s (overrides profile)')
+    parser.add_argument('--connections', type=int, default=6, help='concurrent connections (browsers use 6 per host)')
+    parser.add_argument('--pattern', nargs='+', choices=sorted(PATTERNS), default=DEFAULT_PATTERNS)
+    parser.add_argument('--level', default='A1', choices=[l.upper() for l in LEVELS])
+    parser.add_argument('--lang', default='it', choices=['it', 'en'])
+    parser.add_argument('--waterfall', action='store_true', help='print an ASCII waterfall per run')
+    parser.add_argument('--json', help='write the full waterfalls to this file')
+    run(parser.parse_args())
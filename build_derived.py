@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Incremental build of the derived data files.
+
+Every derived file is declared with the source files it is computed from:
+
+    vocabulary/<lvl>/index.json   <- vocabulary/<lvl>/modules_*.json
+    vocabulary/stats.json         <- vocabulary/*/index.json
+    verbs/index.json              <- verbs/verbs_*.json
+    verbs/stats.json              <- verbs/index.json
+    glossary/reading/<lvl>.json, glossary/stories.json <- reading.json, stories.json, modules, verbs
+
+for both public/data and public/data/en. Input hashes are recorded in
+.cache/derived-state.json; a target is rebuilt only when one of its inputs
+(or its own output) changed. Targets that do not depend on each other are
+built in parallel, and a no-op build only stats the files.
+
+Usage: python3 build_derived.py [--force] [--jobs N]
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import math
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import json_output
+from json_output import report, write_json
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DATA_ROOTS = [
+    os.path.join(ROOT, 'public', 'data'),
+    os.path.join(ROOT, 'public', 'data', 'en'),
+]
+STATE_FILE = os.path.join(ROOT, '.cache', 'derived-state.json')
+
+LEVELS = ['a1', 'a2', 'b1', 'b2', 'c1', 'c2']
+# Page sizes assumed by the loaders in DataContext.jsx and dataLoader.js
+MODULES_PER_CHUNK = 20
+VERBS_PER_CHUNK = 50
+
+
+def load_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def chunk_files(pattern):
+    """Chunk files in numeric order (modules_2 before modules_10)."""
+    return sorted(glob.glob(pattern), key=lambda p: int(re.search(r'(\d+)\.json$', p).group(1)))
+
+
+# ------------------------------------------------------------
+# Builders: (kind, data_root, arg) -> list of warnings
+# ------------------------------------------------------------
+def build_vocab_index(data_root, lvl):
+    files = chunk_files(os.path.join(data_root, 'vocabulary', lvl, 'modules_*.json'))
+    index = []
+    for path in files:
+        for module in load_json(path):
+            index.append({
+                'id': module['id'],
+                'name': module['name'],
+                'category': module['category'],
+                'icon': module['icon'],
+                'wordCount': len(module.get('words', [])),
+            })
+    write_json(os.path.join(data_root, 'vocabulary', lvl, 'index.json'), index)
+    expected = math.ceil(len(index) / MODULES_PER_CHUNK)
+    if expected != len(files):
+        return [f"vocabulary/{lvl}: {len(index)} modules need {expected} chunks, found {len(files)}"]
+    return []
+
+
+def build_vocab_stats(data_root, _):
+    total_words = total_modules = 0
+    for lvl in LEVELS:
+        path = os.path.join(data_root, 'vocabulary', lvl, 'index.json')
+        if not os.path.exists(path):
+            continue
+        index = load_json(path)
+        total_modules += len(index)
+        total_words += sum(m['wordCount'] for m in index)
+    write_json(os.path.join(data_root, 'vocabulary', 'stats.json'),
+               {'totalWords': total_words, 'totalModules': total_modules})
+    return []
+
+
+def build_verb_index(data_root, _):
+    files = chunk_files(os.path.join(data_root, 'verbs', 'verbs_*.json'))
+    index = [
+        {'infinitiv': v['infinitiv'], 'italiano': v['italiano'], 'irregular': v['irregular']}
+        for path in files for v in load_json(path)
+    ]
+    write_json(os.path.join(data_root, 'verbs', 'index.json'), index, indent=None)
+    expected = math.ceil(len(index) / VERBS_PER_CHUNK)
+    if expected != len(files):
+        return [f"verbs: {len(index)} verbs need {expected} chunks, found {len(files)}"]
+    return []
+
+
+def build_verb_stats(data_root, _):
+    index = load_json(os.path.join(data_root, 'verbs', 'index.json'))
+    write_json(os.path.join(data_root, 'verbs', 'stats.json'), {'totalVerbs': len(index)})
+    return []
+
+
+def build_glossaries(data_root, _):
+    import build_glossaries
+    build_glossaries.build(data_root)
+    return []
+
+
+BUILDERS = {
+    'vocab-index': build_vocab_index,
+    'vocab-stats': build_vocab_stats,
+    'verb-index': build_verb_index,
+    'verb-stats': build_verb_stats,
+    'glossary': build_glossaries,
+}
+
+
+def run_target(kind, data_root, arg):
+    """Run one builder; returns its warnings, time and JSON output counts."""
+    t0 = time.perf_counter()
+    before = dict(json_output.STATS)
+    warnings = BUILDERS[kind](data_root, arg)
+    stats = {k: json_output.STATS[k] - before[k] for k in before}
+    return warnings, time.perf_counter() - t0, stats
+
+
+# ------------------------------------------------------------
+# Graph
+# ------------------------------------------------------------
+class Target:
+    def __init__(self, name, kind, data_root, arg, outputs, inputs):
+        self.name = name
+        self.kind = kind
+        self.data_root = data_root
+        self.arg = arg
+        self.outputs = outputs
+        self.inputs = inputs  # callable -> list of paths, evaluated after upstream targets ran
+
+
+def declare_targets(data_root):
+    from build_glossaries import output_files as glossary_files
+    rel = os.path.relpath(data_root, ROOT)
+    vocab = os.path.join(data_root, 'vocabulary')
+    verbs = os.path.join(data_root, 'verbs')
+    targets = []
+    for lvl in LEVELS:
+        if not os.path.isdir(os.path.join(vocab, lvl)):
+            continue
+        targets.append(Target(
+            f'{rel}/vocabulary/{lvl}/index.json', 'vocab-index', data_root, lvl,
+            [os.path.join(vocab, lvl, 'index.json')],
+            lambda lvl=lvl: chunk_files(os.path.join(vocab, lvl, 'modules_*.json')),
+        ))
+    targets.append(Target(
+        f'{rel}/vocabulary/stats.json', 'vocab-stats', data_root, None,
+        [os.path.join(vocab, 'stats.json')],
+        lambda: sorted(glob.glob(os.path.join(vocab, '*', 'index.json'))),
+    ))
+    targets.append(Target(
+        f'{rel}/verbs/index.json', 'verb-index', data_root, None,
+        [os.path.join(verbs, 'index.json')],
+        lambda: chunk_files(os.path.join(verbs, 'verbs_*.json')),
+    ))
+    targets.append(Target(
+        f'{rel}/verbs/stats.json', 'verb-stats', data_root, None,
+        [os.path.join(verbs, 'stats.json')],
+        lambda: [os.path.join(verbs, 'index.json')],
+    ))
+    targets.append(Target(
+        f'{rel}/glossary', 'glossary', data_root, None,
+        glossary_files(data_root),
+        lambda: ([os.path.join(data_root, 'reading.json'), os.path.join(data_root, 'stories.json'),
+                  os.path.join(ROOT, 'build_glossaries.py')]
+                 + sorted(glob.glob(os.path.join(vocab, '*', 'modules_*.json')))
+                 + chunk_files(os.path.join(verbs, 'verbs_*.json'))),
+    ))
+    return targets
+
+
+def waves(targets):
+    """Group targets into waves; a target runs after every target producing one of its inputs."""
+    producer = {out: t for t in targets for out in t.outputs}
+    depth = {}
+
+    def level(t):
+        if t.name not in depth:
+            upstream = {producer[p] for p in t.inputs() if p in producer and producer[p] is not t}
+            depth[t.name] = 1 + max((level(u) for u in upstream), default=-1)
+        return depth[t.name]
+
+    grouped = {}
+    for t in targets:
+        grouped.setdefault(level(t), []).append(t)
+    return [grouped[k] for k in sorted(grouped)]
+
+
+class FileHashes:
+    """Content hashes, recomputed only when a file's size or mtime changed."""
+
+    def __init__(self, state):
+        self.files = state.get('files', {})
+
+    def get(self, path):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        key = os.path.relpath(path, ROOT)
+        entry = self.files.get(key)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+        with open(path, 'rb') as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        self.files[key] = [st.st_size, st.st_mtime_ns, digest]
+        return digest
+
+
+def signature(target, hashes):
+    h = hashlib.sha1(target.kind.encode('utf-8'))
+    for path in target.inputs() + target.outputs:
+        h.update(f"{os.path.relpath(path, ROOT)}={hashes.get(path)}\n".encode('utf-8'))
+    return h.hexdigest()
+
+
+def build(force=False, jobs=None):
+    start = time.perf_counter()
+    state = load_json(STATE_FILE) if os.path.exists(STATE_FILE) and not force else {}
+    hashes = FileHashes(state)
+    signatures = state.get('targets', {})
+
+    targets = [t for data_root in DATA_ROOTS for t in declare_targets(data_root)]
+    built = 0
+    warnings = []
+    executor = None
+    try:
+        for wave in waves(targets):
+            dirty = [t for t in wave if signatures.get(t.name) != signature(t, hashes)]
+            if not dirty:
+                continue
+            if len(dirty) > 1 and executor is None:
+                executor = ProcessPoolExecutor(max_workers=jobs)
+            if executor is not None:
+                results = executor.map(run_target, *zip(*[(t.kind, t.data_root, t.arg) for t in dirty]))
+            else:
+                results = [run_target(t.kind, t.data_root, t.arg) for t in dirty]
+            for t, (target_warnings, elapsed, stats) in zip(dirty, results):
+                print(f"  built {t.name} ({elapsed * 1000:.0f} ms)")
+                if executor is not None:
+                    # Written in a worker process: count it here too
+                    for k, v in stats.items():
+                        json_output.STATS[k] += v
+                warnings.extend(target_warnings)
+                # Outputs changed: rehash them and record the new signature
+                signatures[t.name] = signature(t, hashes)
+                built += 1
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    os.makedirs(os.path.dirname(STATE_FILE), exist_ok=True)
+    write_json(STATE_FILE, {'files': hashes.files, 'targets': signatures}, indent=None)
+
+    for w in warnings:
+        print(f"  WARNING: {w}")
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"{built}/{len(targets)} targets rebuilt in {elapsed:.0f} ms")
+    print(f"JSON output: {report()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Incremental build of the derived data files")
+    parser.add_argument('--force', action='store_true', help='ignore recorded hashes and rebuild everything')
+    parser.add_argument('--jobs', type=int, default=None, help='parallel worker processes')
+    args = parser.parse_args()
+    build(force=args.force, jobs=args.jobs)
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Precompute per-text glossaries and vocabulary coverage for reading and stories.
+
+Tokenizes every text in reading.json and stories.json, resolves each token to a
+lemma through a cached lemma table (vocabulary headwords, noun plurals and verb
+conjugations), joins the lemmas against the level vocabulary and writes next to the source
+files glossary/reading/<lvl>.json (one per level, the reading page shows one
+text at a time) and glossary/stories.json (the stories page lists every level):
+
+    { "<text id>": { "coverage": 91.4, "glossary": {lemma: [translation, level]},
+                     "forms": {word: lemma}, "unknown": [...] } }
+
+"coverage" is the share of running words whose lemma belongs to the vocabulary
+of the text's level or below. "glossary" holds the lemmas above the text's level
+with their translation and vocabulary level, "forms" the inflected words of the
+text that map to those lemmas, "unknown" the words that could not be resolved
+at all. Noun lemmas keep their capital ("Treffen", the meeting) so they do not
+collide with verbs ("treffen", to meet). Stripping an ending never leads to
+a noun, and words capitalized mid-sentence are only looked up as they stand.
+
+Usage: python3 build_glossaries.py
+"""
+
+import glob
+import hashlib
+import json
+import os
+import re
+import time
+
+from json_output import report, write_json
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DATA_ROOTS = [
+    os.path.join(ROOT, 'public', 'data'),        # Italian (default)
+    os.path.join(ROOT, 'public', 'data', 'en'),  # English
+]
+CACHE_DIR = os.path.join(ROOT, '.cache')
+
+LEVELS = ['A1', 'A2', 'B1', 'B2', 'C1', 'C2']
+ARTICLES = ("der ", "die ", "das ")
+UMLAUTS = str.maketrans("äöü", "aou")
+TOKEN_RE = re.compile(r"[^\W\d_]+(?:-[^\W\d_]+)*")
+SUFFIXES = ("ern", "en", "em", "er", "es", "e", "n", "s")
+SENTENCE_BREAK = re.compile(r'[.!?:\n"„“«»]')
+
+# Closed-class words that the vocabulary does not list as headwords but every
+# A1 learner knows. They map to a lemma and count as level A1.
+CORE_WORDS = {
+    "der": "der", "die": "der", "das": "der", "den": "der", "dem": "der", "des": "der",
+    "ein": "ein", "eine": "ein", "einen": "ein", "einem": "ein", "einer": "ein", "eines": "ein",
+    "kein": "kein", "keine": "kein", "keinen": "kein", "keinem": "kein", "keiner": "kein",
+    "am": "an", "ans": "an", "im": "in", "ins": "in", "vom": "von", "zum": "zu", "zur": "zu",
+    "beim": "bei", "aufs": "auf", "fürs": "für",
+    "nicht": "nicht", "dass": "dass", "wenn": "wenn", "weil": "weil", "ob": "ob",
+    "mich": "ich", "mir": "ich", "dich": "du", "dir": "du", "ihn": "er", "ihm": "er",
+    "uns": "wir", "euch": "ihr", "ihnen": "sie", "sich": "sich",
+}
+
+
+def load_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def headword(german):
+    """'der Hund' -> 'Hund'"""
+    word = german.strip()
+    for article in ARTICLES:
+        if word.lower().startswith(article):
+            return word[len(article):]
+    return word
+
+
+def plural_form(singular, plural):
+    """Expand the suffix notation of the plural field: ('Angebot', '-e') -> 'angebote',
+    ('Schwiegermutter', '-mütter') -> 'schwiegermütter'. '-' and '' give None."""
+    singular, plural = singular.lower(), headword(plural).lower()
+    if not plural.startswith('-'):
+        return plural or None
+    ending = plural[1:]
+    if not ending:
+        return None
+    # A longer ending repeats the tail of the word with its umlaut: -mütter
+    plain = ending.translate(UMLAUTS)
+    for i in range(len(plain), 2, -1):
+        if singular.endswith(plain[:i]):
+            return singular[:len(singular) - i] + ending
+    return singular + ending
+
+
+def source_files(data_root):
+    files = sorted(glob.glob(os.path.join(data_root, 'vocabulary', '*', 'modules_*.json')))
+    files += sorted(glob.glob(os.path.join(data_root, 'verbs', 'verbs_*.json')),
+                    key=lambda p: int(re.search(r'(\d+)\.json$', p).group(1)))
+    return files
+
+
+def fingerprint(paths):
+    """Key of the lemma table: the source files plus this script (CORE_WORDS, SUFFIXES, build_lexicon)."""
+    h = hashlib.sha1()
+    with open(os.path.abspath(__file__), 'rb') as f:
+        h.update(hashlib.sha1(f.read()).digest())
+    for path in paths:
+        st = os.stat(path)
+        h.update(f"{path}:{st.st_size}:{st.st_mtime_ns}\n".encode('utf-8'))
+    return h.hexdigest()
+
+
+def build_lexicon(data_root):
+    """Return (lexicon, lemmas, nouns).
+
+    lexicon maps lemma -> [level index, translation]; lemmas maps a lowercased
+    surface form -> lemma for every word but nouns, nouns does the same for
+    noun singulars and plurals. Earlier entries win: core words, then
+    vocabulary headwords, then verb forms in frequency order, except that a
+    verb form replaces a vocabulary word spelled the same.
+    """
+    lexicon = {}
+    lemmas = dict(CORE_WORDS)
+    nouns = {}
+    vocabulary = set()
+
+    for lvl_idx, lvl in enumerate(LEVELS):
+        for path in sorted(glob.glob(os.path.join(data_root, 'vocabulary', lvl.lower(), 'modules_*.json'))):
+            for module in load_json(path):
+                for w in module.get('words', []):
+                    german = w.get('german', '')
+                    lemma = headword(german)
+                    if not lemma:
+                        continue
+                    is_noun = bool(w.get('article')) or lemma != german.strip()
+                    if not is_noun:
+                        lemma = lemma.lower()
+                    if lemma not in lexicon or lexicon[lemma][0] > lvl_idx:
+                        lexicon[lemma] = [lvl_idx, w.get('italian', '')]
+                    if not is_noun:
+                        if lemma not in lemmas:
+                            lemmas[lemma] = lemma
+                            vocabulary.add(lemma)
+                        continue
+                    nouns.setdefault(lemma.lower(), lemma)
+                    plural = plural_form(lemma, w.get('plural') or '')
+                    if plural:
+                        nouns.setdefault(plural, lemma)
+    for lemma in set(CORE_WORDS.values()):
+        lexicon.setdefault(lemma, [0, ""])
+
+    verb_files = [p for p in source_files(data_root) if os.sep + 'verbs' + os.sep in p]
+    for path in verb_files:
+        for verb in load_json(path):
+            inf = verb.get('infinitiv', '').strip().lower()
+            if not inf:
+                continue
+            # The verb tables are the core grammar reference: verbs missing
+            # from the vocabulary count as A1.
+            lexicon.setdefault(inf, [0, verb.get('italiano', '')])
+            forms = [inf]
+            for tense in (verb.get('konjugation') or {}).values():
+                for form in tense.values():
+                    forms += form.lower().replace('!', '').split()
+            for part in forms:
+                # A conjugated form outranks a vocabulary word, not an earlier verb
+                if part not in lemmas or part in vocabulary:
+                    lemmas[part] = inf
+                    vocabulary.discard(part)
+
+    return lexicon, lemmas, nouns
+
+
+def load_lemma_table(data_root):
+    """Build the lexicon and lemma table, reusing .cache/ while sources are unchanged."""
+    key = fingerprint(source_files(data_root))
+    name = hashlib.sha1(data_root.encode('utf-8')).hexdigest()[:12]
+    cache_path = os.path.join(CACHE_DIR, f'lemmas-{name}.json')
+    if os.path.exists(cache_path):
+        cached = load_json(cache_path)
+        if cached.get('key') == key:
+            return cached['lexicon'], cached['lemmas'], cached['nouns'], True
+
+    lexicon, lemmas, nouns = build_lexicon(data_root)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    write_json(cache_path, {'key': key, 'lexicon': lexicon, 'lemmas': lemmas, 'nouns': nouns}, indent=None)
+    return lexicon, lemmas, nouns, False
+
+
+class Lemmatizer:
+    def __init__(self, lexicon, lemmas, nouns):
+        self.lexicon = lexicon
+        self.lemmas = lemmas
+        self.nouns = nouns
+        self.memo = {}
+
+    def resolve(self, token, noun=False):
+        """Return the lemma for a lowercased token, or None if unknown.
+
+        noun is set for words capitalized mid-sentence: they are not stripped
+        ("Müller" is not "Müll") and resolve to a noun, or to another lemma only
+        when it is spelled the same ("Essen" -> essen, but "Nähe" is not "ich nähe").
+        """
+        key = (token, noun)
+        if key in self.memo:
+            return self.memo[key]
+        if noun:
+            lemma = self.nouns.get(token)
+            if lemma is None and self.lemmas.get(token) == token:
+                lemma = token
+        else:
+            lemma = self.lemmas.get(token) or self.nouns.get(token)
+            if lemma is None:
+                # Strip one inflectional ending (adjectives, verb forms); nouns
+                # are only known by their singular and plural
+                for suffix in SUFFIXES:
+                    if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+                        stem = token[:-len(suffix)]
+                        lemma = self.lemmas.get(stem) or self.lemmas.get(stem + 'e') or self.lemmas.get(stem + 'en')
+                        if lemma:
+                            break
+        self.memo[key] = lemma
+        return lemma
+
+
+def analyze(text, level_idx, lemmatizer):
+    lexicon = lemmatizer.lexicon
+    total = known = 0
+    glossary = {}
+    forms = {}
+    unknown = set()
+    last = 0
+    for match in TOKEN_RE.finditer(text):
+        word = match.group(0)
+        token = word.lower()
+        total += 1
+        # Every German noun is capitalized, so only a capital that does not open a sentence says "noun"
+        noun = word[0].isupper() and last > 0 and not SENTENCE_BREAK.search(text, last, match.start())
+        last = match.end()
+        lemma = lemmatizer.resolve(token, noun)
+        if lemma is None or lemma not in lexicon:
+            unknown.add(token)
+            continue
+        lemma_level, translation = lexicon[lemma]
+        if lemma_level <= level_idx:
+            known += 1
+        if lemma_level > level_idx and translation:
+            glossary[lemma] = [translation, LEVELS[lemma_level]]
+            if token != lemma.lower():
+                forms[token] = lemma
+    coverage = round(100 * known / total, 1) if total else 100.0
+    return total, {
+        'coverage': coverage,
+        'glossary': dict(sorted(glossary.items())),
+        'forms': dict(sorted(forms.items())),
+        'unknown': sorted(unknown),
+    }
+
+
+def reading_texts(data):
+    for lvl, block in data.get('levels', {}).items():
+        for item in block.get('texts', []):
+            yield lvl, item['id'], item.get('text', '')
+
+
+def story_texts(data):
+    for lvl, block in data.get('levels', {}).items():
+        for story in block.get('stories', []):
+            lines = [l.get('text', '') for l in story.get('lines', []) if l.get('type') != 'question']
+            yield lvl, story['id'], '\n'.join(lines)
+
+
+# source file, text extractor, one output file per level
+SOURCES = [
+    ('reading.json', reading_texts, True),
+    ('stories.json', story_texts, False),
+]
+
+
+def output_files(data_root):
+    """Every glossary file build() writes for data_root."""
+    out_dir = os.path.join(data_root, 'glossary')
+    files = []
+    for filename, _extract, per_level in SOURCES:
+        if per_level:
+            name = os.path.splitext(filename)[0]
+            files += [os.path.join(out_dir, name, f'{lvl.lower()}.json') for lvl in LEVELS]
+        else:
+            files.append(os.path.join(out_dir, filename))
+    return files
+
+
+def build(data_root):
+    start = time.perf_counter()
+    lexicon, lemmas, nouns, cached = load_lemma_table(data_root)
+    lemmatizer = Lemmatizer(lexicon, lemmas, nouns)
+    table_time = time.perf_counter() - start
+    print(f"{os.path.relpath(data_root, ROOT)}: lemma table {len(lemmas) + len(nouns)} forms / {len(lexicon)} lemmas "
+          f"({'cached' if cached else 'built'} in {table_time * 1000:.0f} ms)")
+
+    for filename, extract, per_level in SOURCES:
+        src = os.path.join(data_root, filename)
+        if not os.path.exists(src):
+            continue
+        t0 = time.perf_counter()
+        result = {lvl: {} for lvl in LEVELS}
+        words = 0
+        coverages = []
+        for lvl, text_id, text in extract(load_json(src)):
+            count, entry = analyze(text, LEVELS.index(lvl), lemmatizer)
+            words += count
+            coverages.append(entry['coverage'])
+            result[lvl][text_id] = entry
+        elapsed = time.perf_counter() - t0
+
+        out_dir = os.path.join(data_root, 'glossary')
+        if per_level:
+            name = os.path.splitext(filename)[0]
+            os.makedirs(os.path.join(out_dir, name), exist_ok=True)
+            for lvl, entries in result.items():
+                write_json(os.path.join(out_dir, name, f'{lvl.lower()}.json'), entries, indent=None)
+        else:
+            os.makedirs(out_dir, exist_ok=True)
+            write_json(os.path.join(out_dir, filename),
+                       {k: v for entries in result.values() for k, v in entries.items()}, indent=None)
+
+        avg = sum(coverages) / len(coverages) if coverages else 0
+        wps = words / elapsed if elapsed else 0
+        print(f"  {filename}: {len(coverages)} texts, {words} words, avg coverage {avg:.1f}% "
+              f"- {elapsed * 1000:.0f} ms ({wps:,.0f} words/s)")
+
+
+if __name__ == "__main__":
+    for data_root in DATA_ROOTS:
+        build(data_root)
+    print(f"\nJSON output: {report()}")
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Per-level offline packs with versioned delta updates for the PWA.
+
+Bundles everything one level needs into a single binary pack per level and
+language, so a device can go offline-ready for a level in one request:
+
+    vocabulary/<lvl>/index.json, vocabulary/<lvl>/modules_*.json
+    grammar/<lvl>.json, essential-words-<lvl>.json
+    verbs/<lvl>.json      verbs first listed in this level's vocabulary (unlisted verbs go to A1)
+    reading.json, stories.json, listening.json, writing.json   -- this level's block only
+    glossary/reading/<lvl>.json, glossary/stories.json (this level's stories only)
+
+Pack layout (all integers big-endian):
+
+    b'DMPK' | u8 format | u8 kind (0 full, 1 delta) | u32 header length | header JSON | payloads
+
+The header lists every entry as {path, sha1, offset, size, rawSize}; each
+payload is the zlib-compressed canonical JSON (sorted keys, compact) of that
+entry, readable in the browser with DecompressionStream('deflate'). Hashes are
+taken on the canonical JSON, so reformatting a data file does not make a new
+version. A delta also carries "base" and the "removed" paths, and only holds
+the entries that changed since "base".
+
+public/packs/<lang>/<lvl>/manifest.json records the current version, its pack,
+the deltas from each older version and the entry hashes of the last
+KEEP_VERSIONS versions. Packs and deltas only need the current data and those
+hashes, so only the manifests are committed; the .pack and .delta files are
+(re)generated from them by `npm run build` (prebuild runs --check). Run it
+after changing data and commit the updated manifests.
+
+--check never makes a new version: it regenerates missing packs and deltas
+for the committed versions and exits with status 1 if a manifest is missing
+or no longer matches the data.
+
+Usage: python3 build_packs.py [--level A1 B1] [--lang it en] [--check]
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import struct
+import sys
+import time
+import zlib
+
+from json_output import dumps, report, write_bytes, write_json
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DATA_ROOTS = {
+    'it': os.path.join(ROOT, 'public', 'data'),
+    'en': os.path.join(ROOT, 'public', 'data', 'en'),
+}
+PACKS_DIR = os.path.join(ROOT, 'public', 'packs')
+
+MAGIC = b'DMPK'
+FORMAT = 1
+KIND_FULL, KIND_DELTA = 0, 1
+PREFIX = struct.Struct('>4sBBI')
+KEEP_VERSIONS = 5
+
+LEVELS = ['A1', 'A2', 'B1', 'B2', 'C1', 'C2']
+LEVELED_FILES = ['reading.json', 'stories.json', 'listening.json', 'writing.json']
+ARTICLES = ("der ", "die ", "das ")
+
+
+def load_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def read_bytes(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def dump(data):
+    return dumps(data, indent=None).encode('utf-8')
+
+
+def chunk_files(pattern):
+    return sorted(glob.glob(pattern), key=lambda p: int(re.search(r'(\d+)\.json$', p).group(1)))
+
+
+# ------------------------------------------------------------
+# Collecting a level
+# ------------------------------------------------------------
+def verb_levels(data_root):
+    """Map each verb infinitive to the first level whose vocabulary lists it."""
+    first = {}
+    for lvl in LEVELS:
+        for path in glob.glob(os.path.join(data_root, 'vocabulary', lvl.lower(), 'modules_*.json')):
+            for module in load_json(path):
+                for w in module.get('words', []):
+                    word = w.get('german', '').strip().lower()
+                    for article in ARTICLES:
+                        if word.startswith(article):
+                            word = word[len(article):]
+                            break
+                    first.setdefault(word, lvl)
+    return first
+
+
+def collect(data_root, level, first_level):
+    """Return {path: bytes} for everything the level needs."""
+    lvl = level.lower()
+    entries = {}
+
+    def add_file(rel):
+        path = os.path.join(data_root, rel)
+        if os.path.exists(path):
+            entries[rel] = dump(load_json(path))
+
+    add_file(f'vocabulary/{lvl}/index.json')
+    for path in chunk_files(os.path.join(data_root, 'vocabulary', lvl, 'modules_*.json')):
+        add_file(os.path.relpath(path, data_root).replace(os.sep, '/'))
+    add_file(f'grammar/{lvl}.json')
+    add_file(f'essential-words-{lvl}.json')
+
+    verbs = [
+        v for path in chunk_files(os.path.join(data_root, 'verbs', 'verbs_*.json')) for v in load_json(path)
+        if first_level.get(v['infinitiv'].lower(), 'A1') == level
+    ]
+    entries[f'verbs/{lvl}.json'] = dump(verbs)
+
+    for name in LEVELED_FILES:
+        path = os.path.join(data_root, name)
+        if os.path.exists(path):
+            block = load_json(path).get('levels', {}).get(level)
+            if block:
+                entries[name] = dump({'levels': {level: block}})
+
+    add_file(f'glossary/reading/{lvl}.json')
+    glossary_path = os.path.join(data_root, 'glossary', 'stories.json')
+    source = os.path.join(data_root, 'stories.json')
+    if os.path.exists(glossary_path) and os.path.exists(source):
+        ids = {s['id'] for s in load_json(source).get('levels', {}).get(level, {}).get('stories', [])}
+        entries['glossary/stories.json'] = dump({k: v for k, v in load_json(glossary_path).items() if k in ids})
+
+    return entries
+
+
+# ------------------------------------------------------------
+# Pack format
+# ------------------------------------------------------------
+def write_pack(path, header, entries, paths):
+    payloads = []
+    offset = 0
+    header['entries'] = []
+    for rel in paths:
+        raw = entries[rel]
+        packed = zlib.compress(raw, 9)
+        header['entries'].append({
+            'path': rel,
+            'sha1': hashlib.sha1(raw).hexdigest(),
+            'offset': offset,
+            'size': len(packed),
+            'rawSize': len(raw),
+        })
+        payloads.append(packed)
+        offset += len(packed)
+    header_bytes = dump(header)
+    kind = KIND_DELTA if 'base' in header else KIND_FULL
+    blob = b''.join([PREFIX.pack(MAGIC, FORMAT, kind, len(header_bytes)), header_bytes] + payloads)
+    write_bytes(path, blob)
+    return len(blob)
+
+
+def read_pack(path):
+    """Return (header, {path: parsed JSON}) for a full or delta pack."""
+    blob = read_bytes(path)
+    magic, fmt, _kind, header_len = PREFIX.unpack_from(blob)
+    if magic != MAGIC or fmt != FORMAT:
+        raise ValueError(f"{path}: not a format {FORMAT} pack")
+    start = PREFIX.size
+    header = json.loads(blob[start:start + header_len])
+    body = start + header_len
+    data = {}
+    for entry in header['entries']:
+        payload = blob[body + entry['offset']:body + entry['offset'] + entry['size']]
+        data[entry['path']] = json.loads(zlib.decompress(payload))
+    return header, data
+
+
+def apply_delta(base, delta_path):
+    """Update the {path: data} of the base version with a delta pack."""
+    header, changed = read_pack(delta_path)
+    updated = {k: v for k, v in base.items() if k not in header.get('removed', [])}
+    updated.update(changed)
+    return header['version'], updated
+
+
+# ------------------------------------------------------------
+# Versioning
+# ------------------------------------------------------------
+def write_version(out_dir, lang, level, version, entries, history):
+    """Write the pack of version and a delta from every older version in history."""
+    lvl = level.lower()
+    pack_name = f'{lvl}-v{version}.pack'
+    pack_size = write_pack(os.path.join(out_dir, pack_name),
+                           {'level': level, 'lang': lang, 'version': version},
+                           entries, sorted(entries))
+    hashes = history[str(version)]
+    deltas = {}
+    for old in sorted(history, key=int):
+        if int(old) == version:
+            continue
+        old_hashes = history[old]
+        changed = [rel for rel, h in hashes.items() if old_hashes.get(rel) != h]
+        removed = sorted(rel for rel in old_hashes if rel not in hashes)
+        delta_name = f'{lvl}-v{old}-v{version}.delta'
+        size = write_pack(os.path.join(out_dir, delta_name),
+                          {'level': level, 'lang': lang, 'version': version, 'base': int(old), 'removed': removed},
+                          entries, changed)
+        deltas[old] = {'file': delta_name, 'size': size, 'changed': len(changed), 'removed': len(removed)}
+    return pack_name, pack_size, deltas
+
+
+def build_level(lang, data_root, level, first_level, check=False):
+    """Bring one pack up to date. Returns False if check is set and the manifest is stale."""
+    out_dir = os.path.join(PACKS_DIR, lang, level.lower())
+    manifest_path = os.path.join(out_dir, 'manifest.json')
+    manifest = load_json(manifest_path) if os.path.exists(manifest_path) else {
+        'level': level, 'lang': lang, 'version': 0, 'history': {},
+    }
+
+    entries = collect(data_root, level, first_level)
+    hashes = {rel: hashlib.sha1(raw).hexdigest() for rel, raw in sorted(entries.items())}
+    raw_size = sum(len(raw) for raw in entries.values())
+    current = manifest['history'].get(str(manifest['version']))
+    if current == hashes:
+        # Same content: only bring back pack and delta files that are missing
+        # (they are not committed). zlib output is deterministic, so they come
+        # out byte for byte as recorded in the manifest.
+        files = [manifest['pack']['file']] + [d['file'] for d in manifest['deltas'].values()]
+        missing = [name for name in files if not os.path.exists(os.path.join(out_dir, name))]
+        if missing:
+            write_version(out_dir, lang, level, manifest['version'], entries, manifest['history'])
+            print(f"  {lang}/{level}: v{manifest['version']} unchanged, regenerated {len(missing)} files")
+        else:
+            print(f"  {lang}/{level}: v{manifest['version']} unchanged")
+        return True
+    if check:
+        print(f"  {lang}/{level}: manifest v{manifest['version']} does not match the data, "
+              f"run build_packs.py and commit the manifest")
+        return False
+
+    version = manifest['version'] + 1
+    os.makedirs(out_dir, exist_ok=True)
+    history = manifest['history']
+    history[str(version)] = hashes
+    for old in sorted(history, key=int)[:-KEEP_VERSIONS]:
+        del history[old]
+    pack_name, pack_size, deltas = write_version(out_dir, lang, level, version, entries, history)
+
+    # Drop packs and deltas that no longer lead to the current version
+    keep = {pack_name} | {d['file'] for d in deltas.values()} | {'manifest.json'}
+    for name in os.listdir(out_dir):
+        if name not in keep:
+            os.remove(os.path.join(out_dir, name))
+
+    manifest.update({
+        'version': version,
+        'pack': {'file': pack_name, 'size': pack_size, 'rawSize': raw_size, 'entries': len(entries)},
+        'deltas': deltas,
+        'history': history,
+    })
+    write_json(manifest_path, manifest)
+
+    t0 = time.perf_counter()
+    read_pack(os.path.join(out_dir, pack_name))
+    unpack_ms = (time.perf_counter() - t0) * 1000
+    line = (f"  {lang}/{level}: v{version}, {len(entries)} entries, {raw_size / 1024:.0f} KB JSON -> "
+            f"{pack_size / 1024:.0f} KB pack, unpack {unpack_ms:.0f} ms")
+    for old, d in sorted(deltas.items(), key=lambda kv: int(kv[0])):
+        line += f"\n      delta v{old}->v{version}: {d['changed']} changed, {d['removed']} removed, {d['size'] / 1024:.1f} KB"
+    print(line)
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build per-level offline packs")
+    parser.add_argument('--level', nargs='+', choices=LEVELS, default=LEVELS)
+    parser.add_argument('--lang', nargs='+', choices=sorted(DATA_ROOTS), default=sorted(DATA_ROOTS))
+    parser.add_argument('--check', action='store_true',
+                        help="only regenerate missing files, fail if a manifest is stale")
+    args = parser.parse_args()
+
+    stale = 0
+    for lang in args.lang:
+        data_root = DATA_ROOTS[lang]
+        first_level = verb_levels(data_root)
+        for level in args.level:
+            if not build_level(lang, data_root, level, first_level, args.check):
+                stale += 1
+    print(f"\nJSON output: {report()}")
+    if stale:
+        sys.exit(f"{stale} stale manifests")
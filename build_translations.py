@@ -6,6 +6,8 @@ Maps each Italian string to its English translation based on the German source w
 
 import json
 
+from json_output import report, write_json
+
 # Comprehensive German-English B1/B2 vocabulary dictionary
 GERMAN_ENGLISH = {
     # Adjectives - Appearance & Quality
@@ -182,7 +184,7 @@ GERMAN_ENGLISH = {
 
 if __name__ == "__main__":
     # Load input
-    with open('/sessions/bold-clever-hopper/deutschemaster-work/untranslated-b1.json', 'r', encoding='utf-8') as f:
+    with open('untranslated-b1.json', 'r', encoding='utf-8') as f:
         data = json.load(f)
 
     # Create output mapping
@@ -197,9 +199,9 @@ if __name__ == "__main__":
             result[italian] = None  # Will be filled in
 
     # Save template
-    with open('/sessions/bold-clever-hopper/deutschemaster-work/translations-b1.json', 'w', encoding='utf-8') as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
+    write_json('translations-b1.json', result)
 
     print(f"Processed {len(data)} entries")
     print(f"Translations found: {sum(1 for v in result.values() if v)}")
     print(f"Missing: {sum(1 for v in result.values() if v is None)}")
+    print(f"\nJSON output: {report()}")
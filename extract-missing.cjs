@@ -1,4 +1,5 @@
 const fs = require('fs');
+const { writeJSON, report } = require('./json-output.cjs');
 
 for (const lvl of ['a2', 'b1']) {
   const trans = JSON.parse(fs.readFileSync(`translations-${lvl}.json`, 'utf8'));
@@ -15,7 +16,9 @@ for (const lvl of ['a2', 'b1']) {
   for (let i = 0; i < missingWithGerman.length; i += chunkSize) {
     const chunk = missingWithGerman.slice(i, i + chunkSize);
     const chunkNum = Math.floor(i / chunkSize) + 1;
-    fs.writeFileSync(`missing-${lvl}-${chunkNum}.json`, JSON.stringify(chunk, null, 2));
+    writeJSON(`missing-${lvl}-${chunkNum}.json`, chunk);
     console.log(`  Written missing-${lvl}-${chunkNum}.json with ${chunk.length} entries`);
   }
 }
+
+console.log(`\nJSON output: ${report()}`);
@@ -1,4 +1,5 @@
 const fs = require('fs');
+const { writeJSON, writeText, report } = require('./json-output.cjs');
 
 // Extract all unique Italian translations that need English equivalents
 const levels = ['a1','a2','b1','b2','c1','c2'];
@@ -43,12 +44,14 @@ const output = {};
 for (const [it, info] of untranslated) {
   output[it] = { german: info.german, level: info.level, count: info.count, english: "" };
 }
-fs.writeFileSync('untranslated.json', JSON.stringify(output, null, 2));
+writeJSON('untranslated.json', output);
 console.log('Written to untranslated.json');
 
 // Also output a simpler format for quick review: german | italian
 const lines = Array.from(untranslated.entries())
   .map(([it, info]) => `${info.german}\t${it}`)
   .sort();
-fs.writeFileSync('untranslated.tsv', lines.join('\n'));
+writeText('untranslated.tsv', lines.join('\n'));
 console.log('Written to untranslated.tsv');
+
+console.log(`\nJSON output: ${report()}`);
@@ -7,9 +7,7 @@ Uses vocabulary dictionary with intelligent fallback translation
 import json
 import re
 
-# Read input
-with open('untranslated-b2.json', 'r', encoding='utf-8') as f:
-    data = json.load(f)
+from json_output import report, write_json
 
 # Build comprehensive German-English dictionary with ~500 core words
 # This covers most B2 vocabulary
@@ -141,48 +139,63 @@ GDE = {
     "gabelkramete": "fork crockery", "gabelkramete": "fork crockery",
 }
 
-# For remaining unmapped items, use intelligent fallback
-output = {}
-
-for item in data:
-    german = item.get("german", "").strip()
-    italian = item.get("italian", "").strip()
-
-    if not italian or not german:
-        continue
-
-    # Get lowercase versions
-    german_lower = german.lower()
-    german_core = german_lower
-
-    # Remove article
-    for article in ["der ", "die ", "das ", "den ", "dem ", "des ", "ein ", "eine ", "einen ", "einem ", "eines "]:
-        if german_lower.startswith(article):
-            german_core = german_lower[len(article):]
-            break
-
-    # Look up translation
-    if german_lower in GDE:
-        english = GDE[german_lower]
-    elif german_core in GDE:
-        english = GDE[german_core]
-    else:
-        # Smart fallback: use German word (it's better than nothing)
-        english = german_core.replace("-", " ").replace("ä", "ae").replace("ö", "oe").replace("ü", "ue").replace("ß", "ss")
-
-    # Add article if Italian had one
-    if italian.startswith(("il ", "la ", "lo ", "l'", "gli ", "i ")):
-        if not english.startswith("the "):
-            english = "the " + english
-    elif italian.startswith(("un ", "una ", "uno ")):
-        if not english.startswith("a "):
-            english = "a " + english
-
-    output[italian] = english
-
-# Write output
-with open('translations-b2.json', 'w', encoding='utf-8') as f:
-    json.dump(output, f, ensure_ascii=False, indent=2)
-
-print(f"Created translations-b2.json with {len(output)} entries")
-print(f"File written to: translations-b2.json")
+INPUT_FILE = 'untranslated-b2.json'
+OUTPUT_FILE = 'translations-b2.json'
+
+
+def translate_entries(data):
+    """Map each Italian string to English, falling back to the German word for unmapped items"""
+    output = {}
+
+    for item in data:
+        german = item.get("german", "").strip()
+        italian = item.get("italian", "").strip()
+
+        if not italian or not german:
+            continue
+
+        # Get lowercase versions
+        german_lower = german.lower()
+        german_core = german_lower
+
+        # Remove article
+        for article in ["der ", "die ", "das ", "den ", "dem ", "des ", "ein ", "eine ", "einen ", "einem ", "eines "]:
+            if german_lower.startswith(article):
+                german_core = german_lower[len(article):]
+                break
+
+        # Look up translation
+        if german_lower in GDE:
+            english = GDE[german_lower]
+        elif german_core in GDE:
+            english = GDE[german_core]
+        else:
+            # Smart fallback: use German word (it's better than nothing)
+            english = german_core.replace("-", " ").replace("ä", "ae").replace("ö", "oe").replace("ü", "ue").replace("ß", "ss")
+
+        # Add article if Italian had one
+        if italian.startswith(("il ", "la ", "lo ", "l'", "gli ", "i ")):
+            if not english.startswith("the "):
+                english = "the " + english
+        elif italian.startswith(("un ", "una ", "uno ")):
+            if not english.startswith("a "):
+                english = "a " + english
+
+        output[italian] = english
+
+    return output
+
+
+if __name__ == "__main__":
+    # Read input
+    with open(INPUT_FILE, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    output = translate_entries(data)
+
+    # Write output
+    write_json(OUTPUT_FILE, output)
+
+    print(f"Created {OUTPUT_FILE} with {len(output)} entries")
+    print(f"File written to: {OUTPUT_FILE}")
+    print(f"\nJSON output: {report()}")
@@ -6,6 +6,8 @@ This script generates the complete translations-b1.json file.
 
 import json
 
+from json_output import report, write_json
+
 # Complete comprehensive German-English dictionary
 # This covers all B1/B2 vocabulary needed for the project
 
@@ -239,9 +241,9 @@ if __name__ == "__main__":
                 result[italian] = None
 
     # Save results
-    with open('translations-b1.json', 'w', encoding='utf-8') as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
+    write_json('translations-b1.json', result)
 
     print(f"Created translations-b1.json")
     print(f"Translated: {matched}/{len(result)} entries")
     print(f"Percentage: {matched/len(result)*100:.1f}%")
+    print(f"\nJSON output: {report()}")
@@ -1,4 +1,5 @@
 const fs = require('fs');
+const { writeJSON, report } = require('./json-output.cjs');
 
 // Step 1: Copy 'it' field from IT files to EN files where missing
 const levels = ['a1','a2','b1','b2','c1','c2'];
@@ -32,7 +33,7 @@ for (const lvl of levels) {
     }
   }
 
-  fs.writeFileSync(enFile, JSON.stringify(enData, null, 2));
+  writeJSON(enFile, enData);
   console.log(`${lvl.toUpperCase()}: fixed ${fixedIt} 'it' fields`);
 }
 
@@ -60,7 +61,7 @@ for (const lvl of levels) {
   }
 }
 
-fs.writeFileSync('essential-needs-en.json', JSON.stringify(needsEN, null, 2));
+writeJSON('essential-needs-en.json', needsEN);
 console.log(`Total words needing EN translation: ${needsEN.length}`);
 
 // Step 3: Extract example sentences needing EN translation
@@ -83,5 +84,7 @@ for (const lvl of levels) {
   }
 }
 
-fs.writeFileSync('essential-needs-exampleEn.json', JSON.stringify(needsExEN, null, 2));
+writeJSON('essential-needs-exampleEn.json', needsExEN);
 console.log(`Total example sentences needing EN translation: ${needsExEN.length}`);
+
+console.log(`\nJSON output: ${report()}`);
@@ -1,5 +1,6 @@
 const fs = require('fs');
 const path = require('path');
+const { writeJSON, report } = require('./json-output.cjs');
 
 // Manual fixes for remaining vocabulary words
 const vocabFixes = {
@@ -48,7 +49,7 @@ for (const lvl of levels) {
     }
 
     if (changed) {
-      fs.writeFileSync(path.join(enDir, f), JSON.stringify(enData, null, 2));
+      writeJSON(path.join(enDir, f), enData);
     }
   }
 }
@@ -77,9 +78,11 @@ for (const lvl of levels) {
     }
 
     if (changed) {
-      fs.writeFileSync(path.join(enDir, f), JSON.stringify(enData, null, 2));
+      writeJSON(path.join(enDir, f), enData);
     }
   }
 }
 
 console.log(`\nTotal vocab fixes: ${totalFixed}`);
+
+console.log(`\nJSON output: ${report()}`);
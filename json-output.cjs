@@ -0,0 +1,138 @@
+// Deterministic, atomic JSON writer for the .cjs tools (twin of json_output.py).
+//
+// writeJSON(file, data, indent = 2) writes canonical JSON: keys sorted (also
+// integer-like keys, which JSON.stringify would put first), UTF-8 without
+// escaping, no trailing newline. Files whose bytes or parsed data would not
+// change are left alone; changed files are written to a temp file in the same
+// directory, flushed to disk and renamed over the target.
+const fs = require('fs');
+const path = require('path');
+const { performance } = require('perf_hooks');
+
+const stats = { written: 0, unchanged: 0, ms: 0 };
+
+// Native JSON.stringify is canonical when every object already lists its keys
+// in sorted order, which holds for anything read back from a file we wrote.
+function isCanonical(value) {
+  if (Array.isArray(value)) {
+    for (let i = 0; i < value.length; i++) {
+      const item = value[i];
+      if (typeof item === 'object' && item !== null && !isCanonical(item)) return false;
+    }
+    return true;
+  }
+  if (typeof value.toJSON === 'function') return false;
+  const keys = Object.keys(value);
+  for (let i = 0; i < keys.length; i++) {
+    if (i && keys[i - 1] > keys[i]) return false;
+    const item = value[keys[i]];
+    if (typeof item === 'object' && item !== null && !isCanonical(item)) return false;
+  }
+  return true;
+}
+
+// Otherwise serialize by hand: integer-like keys ("2", "10") always come first
+// in a JS object, so sorting the keys of a copy is not enough.
+function serialize(value, indent, prefix) {
+  if (value === null) return 'null';
+  switch (typeof value) {
+    case 'string': return JSON.stringify(value);
+    case 'number': return isFinite(value) ? String(value) : 'null';
+    case 'boolean': return value ? 'true' : 'false';
+    case 'object': break;
+    default: return undefined;
+  }
+  if (typeof value.toJSON === 'function') return serialize(value.toJSON(), indent, prefix);
+  const inner = prefix + indent;
+  const sep = indent ? ',\n' + inner : ',';
+  let out = '';
+  if (Array.isArray(value)) {
+    if (value.length === 0) return '[]';
+    for (let i = 0; i < value.length; i++) {
+      const item = serialize(value[i], indent, inner);
+      out += (i ? sep : '') + (item === undefined ? 'null' : item);
+    }
+    return indent ? '[\n' + inner + out + '\n' + prefix + ']' : '[' + out + ']';
+  }
+  const colon = indent ? ': ' : ':';
+  let first = true;
+  for (const k of Object.keys(value).sort()) {
+    const item = serialize(value[k], indent, inner);
+    if (item === undefined) continue;
+    out += (first ? '' : sep) + JSON.stringify(k) + colon + item;
+    first = false;
+  }
+  if (first) return '{}';
+  return indent ? '{\n' + inner + out + '\n' + prefix + '}' : '{' + out + '}';
+}
+
+function stringify(data, indent = 2) {
+  if (typeof data !== 'object' || data === null || isCanonical(data)) {
+    return JSON.stringify(data, null, indent || undefined);
+  }
+  return serialize(data, indent ? ' '.repeat(indent) : '', '');
+}
+
+// same(existing) may accept other bytes as equivalent, e.g. the same data
+// formatted differently; it is only asked when the bytes differ.
+function writeText(file, text, same = null) {
+  const start = performance.now();
+  try {
+    const content = Buffer.from(text, 'utf8');
+    let mode = null;  // new files get the default 0o666 minus umask
+    const st = fs.statSync(file, { throwIfNoEntry: false });
+    if (st) {
+      let existing = null;
+      let unchanged = false;
+      if (st.size === content.length) {
+        existing = fs.readFileSync(file);
+        unchanged = existing.equals(content);
+      }
+      if (!unchanged && same) unchanged = same(existing || fs.readFileSync(file));
+      if (unchanged) {
+        stats.unchanged++;
+        return false;
+      }
+      mode = st.mode & 0o777;
+    }
+
+    const tmp = path.join(path.dirname(file), `.${path.basename(file)}.${process.pid}.tmp`);
+    try {
+      const fd = fs.openSync(tmp, 'w');
+      try {
+        fs.writeSync(fd, content);
+        fs.fsyncSync(fd);
+      } finally {
+        fs.closeSync(fd);
+      }
+      if (mode !== null) fs.chmodSync(tmp, mode);
+      fs.renameSync(tmp, file);
+    } catch (e) {
+      fs.rmSync(tmp, { force: true });
+      throw e;
+    }
+    stats.written++;
+    return true;
+  } finally {
+    stats.ms += performance.now() - start;
+  }
+}
+
+function writeJSON(file, data, indent = 2) {
+  const start = performance.now();
+  const text = stringify(data, indent);
+  stats.ms += performance.now() - start;
+  return writeText(file, text, existing => {
+    try {
+      return stringify(JSON.parse(existing.toString('utf8')), indent) === text;
+    } catch {
+      return false;
+    }
+  });
+}
+
+function report() {
+  return `${stats.written} files written, ${stats.unchanged} unchanged (${stats.ms.toFixed(0)} ms)`;
+}
+
+module.exports = { stringify, writeJSON, writeText, stats, report };
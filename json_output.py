@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Deterministic, atomic JSON writer shared by the data scripts.
+
+Every script that produces a data file writes it through write_json():
+
+    - canonical bytes: keys sorted, UTF-8 without escaping, no trailing
+      newline; indent=2 for files people edit, indent=None for compact ones
+    - a file whose bytes or parsed data would not change is not written at
+      all, so its mtime is kept and the incremental builds (build_derived.py,
+      build_packs.py, the watch mode) see no change; committed files keep
+      their formatting until their data changes
+    - changed files go to a temp file in the same directory, are flushed to
+      disk and renamed over the target, so neither readers nor a crash
+      mid-write leave a truncated file
+
+json-output.cjs is the twin used by the .cjs tools and produces the same
+bytes for the same data (except whole floats: 84.0 here, 84 in JavaScript).
+STATS counts what a run wrote; report() summarizes it.
+"""
+
+import json
+import os
+import tempfile
+import time
+
+STATS = {'written': 0, 'unchanged': 0, 'seconds': 0.0}
+
+_umask = os.umask(0)
+os.umask(_umask)
+
+
+def dumps(data, indent=2):
+    """Canonical JSON text of data."""
+    if indent is None:
+        return json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return json.dumps(data, ensure_ascii=False, sort_keys=True, indent=indent)
+
+
+def write_bytes(path, content, same=None):
+    """Atomically replace path with content unless it already holds it. Returns True if written.
+
+    same(existing bytes) may accept other bytes as equivalent, e.g. the same data
+    formatted differently; it is only asked when the bytes differ.
+    """
+    start = time.perf_counter()
+    try:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            mode = 0o666 & ~_umask
+        else:
+            if st.st_size == len(content):
+                with open(path, 'rb') as f:
+                    existing = f.read()
+                unchanged = existing == content
+            else:
+                existing = None
+                unchanged = False
+            if not unchanged and same is not None:
+                if existing is None:
+                    with open(path, 'rb') as f:
+                        existing = f.read()
+                unchanged = same(existing)
+            if unchanged:
+                STATS['unchanged'] += 1
+                return False
+            mode = st.st_mode & 0o777
+
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=f'.{os.path.basename(path)}.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp, mode)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        STATS['written'] += 1
+        return True
+    finally:
+        STATS['seconds'] += time.perf_counter() - start
+
+
+def _same_data(content, indent):
+    # Compare canonical text, not Python values: True == 1 and 84 == 84.0
+    def same(existing):
+        try:
+            return dumps(json.loads(existing), indent).encode('utf-8') == content
+        except ValueError:
+            return False
+    return same
+
+
+def write_json(path, data, indent=2):
+    """Write data to path as canonical JSON unless it already holds the same data. Returns True if written."""
+    start = time.perf_counter()
+    content = dumps(data, indent).encode('utf-8')
+    STATS['seconds'] += time.perf_counter() - start
+    return write_bytes(path, content, _same_data(content, indent))
+
+
+def report(since=None):
+    """Summary of STATS, or of what changed after the copy of STATS in since."""
+    stats = STATS if since is None else {k: STATS[k] - since[k] for k in STATS}
+    return (f"{stats['written']} files written, {stats['unchanged']} unchanged "
+            f"({stats['seconds'] * 1000:.0f} ms)")
@@ -1,5 +1,6 @@
 const fs = require('fs');
 const path = require('path');
+const { writeJSON, report } = require('./json-output.cjs');
 
 // Step 1: Merge all translation chunks into the main translation files
 console.log("=== MERGING TRANSLATION CHUNKS ===");
@@ -22,7 +23,7 @@ for (const lvl of ['a2', 'b1']) {
     }
   }
 
-  fs.writeFileSync(mainFile, JSON.stringify(main, null, 2));
+  writeJSON(mainFile, main);
   const filled = Object.values(main).filter(v => v && typeof v === 'string' && v.trim() !== '').length;
   const total = Object.keys(main).length;
   console.log(`${lvl.toUpperCase()}: merged ${merged} new translations. Now ${filled}/${total} filled.`);
@@ -86,7 +87,7 @@ for (const lvl of levels) {
     }
 
     if (fileChanged) {
-      fs.writeFileSync(path.join(enDir, f), JSON.stringify(enData, null, 2));
+      writeJSON(path.join(enDir, f), enData);
     }
   }
 
@@ -97,3 +98,5 @@ for (const lvl of levels) {
 }
 
 console.log(`\nTOTAL: ${totalUpdated} words updated, ${totalSkipped} skipped, ${totalAlreadyEN} already English`);
+
+console.log(`\nJSON output: ${report()}`);
@@ -7,14 +7,34 @@ import { useData } from '../DataContext';
 import { saveDifficultWord, removeDifficultWord, isDifficultWord } from '../utils/storage';
 import { saveAndSync } from '../utils/cloudSync';
 
+// Precomputed by build_glossaries.py; one file per language and level, fetched once.
+const glossaryCache = new Map();
+
+async function fetchReadingGlossary(language, level) {
+  const key = `${language}/${level}`;
+  if (glossaryCache.has(key)) return glossaryCache.get(key);
+  const base = import.meta.env.BASE_URL + 'data';
+  const file = `glossary/reading/${level.toLowerCase()}.json`;
+  let data = null;
+  if (language && language !== 'it') {
+    try { const r = await fetch(`${base}/${language}/${file}`); if (r.ok) data = await r.json(); } catch {}
+  }
+  if (!data) {
+    try { const r = await fetch(`${base}/${file}`); if (r.ok) data = await r.json(); } catch {}
+  }
+  if (data) glossaryCache.set(key, data);
+  return data;
+}
+
 function ReadingDetail({ reading, level, colors, allTexts, onNavigate }) {
-  const { t } = useLanguage();
+  const { t, language } = useLanguage();
   const currentIndex = allTexts ? allTexts.findIndex(tx => tx.id === reading.id) : -1;
   const nextReading = currentIndex >= 0 && currentIndex < allTexts.length - 1 ? allTexts[currentIndex + 1] : null;
   const prevReading = currentIndex > 0 ? allTexts[currentIndex - 1] : null;
   const [answers, setAnswers] = useState({});
   const [showScore, setShowScore] = useState(false);
   const [savedWords, setSavedWords] = useState({});
+  const [glossary, setGlossary] = useState(null);
 
   useEffect(() => {
     if (reading.difficultWords) {
@@ -26,6 +46,14 @@ function ReadingDetail({ reading, level, colors, allTexts, onNavigate }) {
     }
   }, [reading]);
 
+  useEffect(() => {
+    let cancelled = false;
+    fetchReadingGlossary(language, level).then(data => {
+      if (!cancelled) setGlossary(data?.[reading.id] || null);
+    });
+    return () => { cancelled = true; };
+  }, [reading.id, language, level]);
+
   useEffect(() => {
     return () => { window.speechSynthesis.cancel(); };
   }, []);
@@ -96,6 +124,9 @@ function ReadingDetail({ reading, level, colors, allTexts, onNavigate }) {
           <div className="reading-header-meta">
             <span className="reading-level-badge" style={{backgroundColor: colors.bg}}>{level}</span>
             <span className="reading-theme-label">{reading.theme}</span>
+            {glossary && (
+              <span className="reading-theme-label">{Math.round(glossary.coverage)}% {t('reading.coverage')}</span>
+            )}
             {currentIndex >= 0 && (
               <span className="reading-counter">{currentIndex + 1}/{allTexts.length}</span>
             )}
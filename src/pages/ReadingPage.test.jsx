@@ -16,6 +16,7 @@ vi.mock('../contexts/LanguageContext', () => ({
         'reading.perfect': 'Perfect!',
         'reading.goodJob': 'Good job!',
         'reading.tryAgain': 'Try again!',
+        'reading.coverage': 'known vocabulary',
       };
       return map[key] || key;
     },
@@ -149,4 +150,27 @@ describe('ReadingPage', () => {
       expect(screen.getByText('No reading texts available')).toBeTruthy();
     });
   });
+
+  describe('Detail View', () => {
+    const reading = {
+      id: 'r1',
+      title: 'Morning Routine',
+      theme: 'Daily Life',
+      text: 'Ich stehe um 7 Uhr auf.',
+      difficultWords: [],
+      questions: [],
+    };
+
+    it('shows vocabulary coverage from the precomputed glossary', async () => {
+      global.fetch = vi.fn(() => Promise.resolve({
+        ok: true,
+        json: () => Promise.resolve({ r1: { coverage: 87.5, glossary: {}, forms: {}, unknown: [] } }),
+      }));
+      render(<ReadingPage level="A1" reading={reading} onNavigate={onNavigate} />);
+      await waitFor(() => {
+        expect(screen.getByText('88% known vocabulary')).toBeTruthy();
+      });
+      expect(global.fetch).toHaveBeenCalledWith(expect.stringContaining('en/glossary/reading/a1.json'));
+    });
+  });
 });
@@ -6,7 +6,7 @@ import { saveAndSync } from '../utils/cloudSync';
 import { addXP } from '../utils/gamification';
 import { useLanguage } from '../contexts/LanguageContext';
 
-function InlineStory({ story, level, colors, storyRef, onNextStory, hasNext, t, isCompleted: initialCompleted }) {
+function InlineStory({ story, level, colors, storyRef, onNextStory, hasNext, t, isCompleted: initialCompleted, coverage }) {
   const [answers, setAnswers] = useState({});
   const [markedComplete, setMarkedComplete] = useState(initialCompleted);
 
@@ -63,6 +63,12 @@ function InlineStory({ story, level, colors, storyRef, onNextStory, hasNext, t,
             <span>{storyTextLines} righe</span>
             <span className="stories-card-meta-dot">·</span>
             <span>{storyQuestions} domande</span>
+            {coverage != null && (
+              <>
+                <span className="stories-card-meta-dot">·</span>
+                <span>{Math.round(coverage)}% {t('reading.coverage')}</span>
+              </>
+            )}
             {story.characters && story.characters.length > 0 && (
               <>
                 <span className="stories-card-meta-dot">·</span>
@@ -160,6 +166,7 @@ export default function StoriesPage({ level, reading, onNavigate }) {
   const { canAccessLevel } = useLevelAccess();
   const { t, language } = useLanguage();
   const [stories, setStories] = useState([]);
+  const [glossary, setGlossary] = useState({});
   const [completedStories, setCompletedStories] = useState([]);
   const [loading, setLoading] = useState(true);
   const storyRefs = useRef({});
@@ -170,16 +177,20 @@ export default function StoriesPage({ level, reading, onNavigate }) {
     const fetchStories = async () => {
       try {
         const base = import.meta.env.BASE_URL + 'data';
-        const langPath = language && language !== 'it' ? `${base}/${language}/stories.json` : null;
-        let data = null;
-        if (langPath) {
-          try { const r = await fetch(langPath); if (r.ok) data = await r.json(); } catch {}
-        }
-        if (!data) {
-          const r = await fetch(`${base}/stories.json`);
-          data = await r.json();
-        }
+        const fetchWithFallback = async (path) => {
+          if (language && language !== 'it') {
+            try { const r = await fetch(`${base}/${language}/${path}`); if (r.ok) return await r.json(); } catch {}
+          }
+          const r = await fetch(`${base}/${path}`);
+          return r.json();
+        };
+        // The glossary is optional: a missing file must not block the stories
+        const [data, glossaryData] = await Promise.all([
+          fetchWithFallback('stories.json'),
+          fetchWithFallback('glossary/stories.json').catch(() => null),
+        ]);
         setStories(data.levels || {});
+        setGlossary(glossaryData || {});
         const completed = JSON.parse(localStorage.getItem('dm_completed_stories') || '[]');
         setCompletedStories(completed);
       } catch (e) {
@@ -272,6 +283,7 @@ export default function StoriesPage({ level, reading, onNavigate }) {
                       onNextStory={() => nextStory && scrollToStory(nextStory.id)}
                       t={t}
                       isCompleted={completedStories.includes(story.id)}
+                      coverage={glossary[story.id]?.coverage}
                     />
                   );
                 })}
@@ -11,6 +11,7 @@ vi.mock('../contexts/LanguageContext', () => ({
         'stories.interactive': 'Interactive Stories',
         'stories.stories': 'stories',
         'stories.noStories': 'No stories available',
+        'reading.coverage': 'known vocabulary',
       };
       return map[key] || key;
     },
@@ -126,4 +127,15 @@ describe('StoriesPage', () => {
       expect(screen.getByText('No stories available')).toBeTruthy();
     });
   });
+
+  it('shows vocabulary coverage from the precomputed glossary', async () => {
+    global.fetch = vi.fn((url) => Promise.resolve({
+      ok: true,
+      json: () => Promise.resolve(url.includes('glossary/') ? { s1: { coverage: 92.3, glossary: {}, forms: {}, unknown: [] } } : mockStories),
+    }));
+    render(<StoriesPage level="A1" onNavigate={onNavigate} />);
+    await waitFor(() => {
+      expect(screen.getByText('92% known vocabulary')).toBeTruthy();
+    });
+  });
 });
@@ -7,9 +7,7 @@ Translates B2-level German vocabulary to English
 import json
 import re
 
-# Read the input file
-with open('/sessions/bold-clever-hopper/deutschemaster-work/untranslated-b2.json', 'r', encoding='utf-8') as f:
-    data = json.load(f)
+from json_output import report, write_json
 
 # Comprehensive German->English translation dictionary
 # This is built from linguistic knowledge of German vocabulary
@@ -71,75 +69,90 @@ GERMAN_ENGLISH = {
     "drohne": "drone", "durchbruch": "breakthrough", "dürre": "drought",
 }
 
-# Process all items and create final mapping
-output_mapping = {}
-
-for item in data:
-    german = item.get("german", "").strip()
-    italian = item.get("italian", "").strip()
-
-    if not italian or not german:
-        continue
-
-    # Convert German to lowercase for lookup (but preserve original for reference)
-    german_lower = german.lower()
-
-    # Remove German article from the German word to get the core term
-    german_core = german_lower
-    for article in ["der ", "die ", "das ", "den ", "dem ", "des ", "ein ", "eine ", "einen ", "einem ", "eines "]:
-        if german_lower.startswith(article):
-            german_core = german_lower[len(article):]
-            break
-
-    # Check if Italian has article
-    italian_article = ""
-    italian_core = italian
-
-    if italian.startswith("il "):
-        italian_article = "the "
-        italian_core = italian[3:]
-    elif italian.startswith("la "):
-        italian_article = "the "
-        italian_core = italian[3:]
-    elif italian.startswith("lo "):
-        italian_article = "the "
-        italian_core = italian[3:]
-    elif italian.startswith("l'"):
-        italian_article = "the "
-        italian_core = italian[2:]
-    elif italian.startswith("un "):
-        italian_article = "a "
-        italian_core = italian[3:]
-    elif italian.startswith("una "):
-        italian_article = "a "
-        italian_core = italian[4:]
-    elif italian.startswith("uno "):
-        italian_article = "a "
-        italian_core = italian[4:]
-    elif italian.startswith("gli "):
-        italian_article = "the "
-        italian_core = italian[4:]
-    elif italian.startswith("i "):
-        italian_article = "the "
-        italian_core = italian[2:]
-
-    # Look up translation
-    if german_lower in GERMAN_ENGLISH:
-        english_translation = GERMAN_ENGLISH[german_lower]
-    elif german_core in GERMAN_ENGLISH:
-        english_translation = GERMAN_ENGLISH[german_core]
-    else:
-        # Use German word lowercased as fallback
-        english_translation = german_core
-
-    # Add article if the translation doesn't already start with one and Italian had one
-    if italian_article and not english_translation.startswith("the ") and not english_translation.startswith("a "):
-        english_translation = italian_article + english_translation
-
-    output_mapping[italian] = english_translation
-
-# Write output
-with open('/sessions/bold-clever-hopper/deutschemaster-work/translations-b2.json', 'w', encoding='utf-8') as f:
-    json.dump(output_mapping, f, ensure_ascii=False, indent=2)
-
-print(f"Created translations-b2.json with {len(output_mapping)} entries")
+INPUT_FILE = 'untranslated-b2.json'
+OUTPUT_FILE = 'translations-b2.json'
+
+
+def translate_entries(data):
+    """Map each Italian string of the untranslated entries to its English translation"""
+    output_mapping = {}
+
+    for item in data:
+        german = item.get("german", "").strip()
+        italian = item.get("italian", "").strip()
+
+        if not italian or not german:
+            continue
+
+        # Convert German to lowercase for lookup (but preserve original for reference)
+        german_lower = german.lower()
+
+        # Remove German article from the German word to get the core term
+        german_core = german_lower
+        for article in ["der ", "die ", "das ", "den ", "dem ", "des ", "ein ", "eine ", "einen ", "einem ", "eines "]:
+            if german_lower.startswith(article):
+                german_core = german_lower[len(article):]
+                break
+
+        # Check if Italian has article
+        italian_article = ""
+        italian_core = italian
+
+        if italian.startswith("il "):
+            italian_article = "the "
+            italian_core = italian[3:]
+        elif italian.startswith("la "):
+            italian_article = "the "
+            italian_core = italian[3:]
+        elif italian.startswith("lo "):
+            italian_article = "the "
+            italian_core = italian[3:]
+        elif italian.startswith("l'"):
+            italian_article = "the "
+            italian_core = italian[2:]
+        elif italian.startswith("un "):
+            italian_article = "a "
+            italian_core = italian[3:]
+        elif italian.startswith("una "):
+            italian_article = "a "
+            italian_core = italian[4:]
+        elif italian.startswith("uno "):
+            italian_article = "a "
+            italian_core = italian[4:]
+        elif italian.startswith("gli "):
+            italian_article = "the "
+            italian_core = italian[4:]
+        elif italian.startswith("i "):
+            italian_article = "the "
+            italian_core = italian[2:]
+
+        # Look up translation
+        if german_lower in GERMAN_ENGLISH:
+            english_translation = GERMAN_ENGLISH[german_lower]
+        elif german_core in GERMAN_ENGLISH:
+            english_translation = GERMAN_ENGLISH[german_core]
+        else:
+            # Use German word lowercased as fallback
+            english_translation = german_core
+
+        # Add article if the translation doesn't already start with one and Italian had one
+        if italian_article and not english_translation.startswith("the ") and not english_translation.startswith("a "):
+            english_translation = italian_article + english_translation
+
+        output_mapping[italian] = english_translation
+
+    return output_mapping
+
+
+if __name__ == "__main__":
+    # Read the input file
+    with open(INPUT_FILE, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    output_mapping = translate_entries(data)
+
+    # Write output
+    write_json(OUTPUT_FILE, output_mapping)
+
+    print(f"Created {OUTPUT_FILE} with {len(output_mapping)} entries")
+    print(f"\nJSON output: {report()}")
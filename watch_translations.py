@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Watch mode for the translation pipeline.
+
+Keeps the lexicon, the translation tables and the IT/EN vocabulary in memory
+and re-runs only the affected steps when a file is saved:
+
+    lexicon source (final_translate.py) or untranslated-b2.json
+        -> translate (translations-b2.json) -> apply -> validate
+    trans-<lvl>-N.json chunk
+        -> merge (translations-<lvl>.json) -> apply -> validate
+    translations-<lvl>.json
+        -> apply -> validate
+    vocabulary modules (IT or EN), e.g. edited by hand or by fix-remaining.cjs
+        -> re-index -> apply -> validate
+
+The merge and apply steps mirror merge-and-apply.cjs, but only the EN words
+that still carry the Italian text are revisited and only the vocabulary files
+that actually change are written. Apply re-reads each file from disk before
+patching it, so edits made while the watcher runs are kept. Validation runs
+check-translations.cjs.
+
+The committed translations-b2.json is final_translate.py output, hence the
+default lexicon.
+
+Usage: python3 watch_translations.py [--lexicon translate.py] [--no-validate] [--once]
+"""
+
+import argparse
+import glob
+import importlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+
+import json_output
+from json_output import write_json
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+LEVELS = ['a1', 'a2', 'b1', 'b2', 'c1', 'c2']
+TRANSLATE_INPUT = 'untranslated-b2.json'
+TRANSLATE_OUTPUT = 'translations-b2.json'
+CHUNK_RE = re.compile(r'^trans-([a-c][12])-(\d+)\.json$')
+MAIN_RE = re.compile(r'^translations-([a-c][12])\.json$')
+VOCAB_PATTERNS = ['public/data/vocabulary/*/modules_*.json', 'public/data/en/vocabulary/*/modules_*.json']
+
+
+def load_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def is_filled(value):
+    return isinstance(value, str) and value.strip() != ''
+
+
+class Pipeline:
+    def __init__(self, lexicon_file, validate=True):
+        self.lexicon_file = lexicon_file
+        self.lexicon_module = None
+        self.validate_enabled = validate and shutil.which('node') is not None
+        self.translations = {}   # lvl -> {italian: english}
+        self.master = {}         # merged dictionary of all levels
+        self.en_files = []       # EN vocabulary module paths
+        self.pending = []        # (en path, module idx, word idx, italian) still untranslated
+        self.written = set()     # files written by the last rebuild
+
+    # ------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------
+    def load_lexicon(self):
+        name = os.path.splitext(self.lexicon_file)[0]
+        if self.lexicon_module is None:
+            self.lexicon_module = importlib.import_module(name)
+        else:
+            self.lexicon_module = importlib.reload(self.lexicon_module)
+
+    def load_translations(self, lvl):
+        path = os.path.join(ROOT, f'translations-{lvl}.json')
+        self.translations[lvl] = load_json(path) if os.path.exists(path) else {}
+
+    def rebuild_master(self):
+        self.master = {}
+        for lvl in LEVELS:
+            for it, en in self.translations.get(lvl, {}).items():
+                if is_filled(en):
+                    self.master[it] = en
+
+    def load_vocabulary(self):
+        """Index every EN word that still has the same text as its IT counterpart."""
+        self.en_files = []
+        self.pending = []
+        for lvl in LEVELS:
+            it_dir = os.path.join(ROOT, 'public', 'data', 'vocabulary', lvl)
+            en_dir = os.path.join(ROOT, 'public', 'data', 'en', 'vocabulary', lvl)
+            for en_path in sorted(glob.glob(os.path.join(en_dir, 'modules_*.json'))):
+                it_path = os.path.join(it_dir, os.path.basename(en_path))
+                if not os.path.exists(it_path):
+                    continue
+                it_data = load_json(it_path)
+                en_data = load_json(en_path)
+                self.en_files.append(en_path)
+                for m, en_mod in enumerate(en_data):
+                    it_mod = it_data[m] if m < len(it_data) else None
+                    if not en_mod or not en_mod.get('words') or not it_mod or not it_mod.get('words'):
+                        continue
+                    for w, en_w in enumerate(en_mod['words']):
+                        it_w = it_mod['words'][w] if w < len(it_mod['words']) else None
+                        if it_w and en_w.get('italian') == it_w.get('italian'):
+                            self.pending.append((en_path, m, w, en_w.get('italian')))
+
+    def warm_up(self):
+        self.load_lexicon()
+        for lvl in LEVELS:
+            self.load_translations(lvl)
+        self.rebuild_master()
+        self.load_vocabulary()
+
+    # ------------------------------------------------------------
+    # Steps
+    # ------------------------------------------------------------
+    def translate(self):
+        data = load_json(os.path.join(ROOT, TRANSLATE_INPUT))
+        result = self.lexicon_module.translate_entries(data)
+        out = os.path.join(ROOT, TRANSLATE_OUTPUT)
+        if write_json(out, result):
+            self.written.add(out)
+        return f"{len(result)} entries"
+
+    def merge(self, lvl):
+        """Merge trans-<lvl>-N.json chunks into translations-<lvl>.json"""
+        main = self.translations.setdefault(lvl, {})
+        merged = 0
+        for i in range(1, 11):
+            chunk_path = os.path.join(ROOT, f'trans-{lvl}-{i}.json')
+            if not os.path.exists(chunk_path):
+                break
+            for it, en in load_json(chunk_path).items():
+                if is_filled(en) and main.get(it) != en:
+                    main[it] = en
+                    merged += 1
+        if merged:
+            out = os.path.join(ROOT, f'translations-{lvl}.json')
+            if write_json(out, main):
+                self.written.add(out)
+        return merged
+
+    def apply(self):
+        def translation(italian):
+            # Words spelled the same in both languages ("hotel") need no rewrite
+            english = self.master.get(italian)
+            return english if english and english != italian else None
+
+        by_file = {}
+        for entry in self.pending:
+            by_file.setdefault(entry[0], []).append(entry)
+        remaining = []
+        updated = files = 0
+        for en_path, entries in sorted(by_file.items()):
+            if not any(translation(italian) for *_, italian in entries):
+                remaining.extend(entries)
+                continue
+            # Patch the file as it is on disk now, not as it was at warm-up
+            en_data = load_json(en_path)
+            changed = False
+            for entry in entries:
+                _, m, w, italian = entry
+                try:
+                    word = en_data[m]['words'][w]
+                except (IndexError, KeyError, TypeError):
+                    continue
+                if word.get('italian') != italian:
+                    continue  # edited meanwhile; the next re-index picks it up
+                english = translation(italian)
+                if english:
+                    word['italian'] = english
+                    changed = True
+                    updated += 1
+                else:
+                    remaining.append(entry)
+            if changed:
+                files += 1
+                if write_json(en_path, en_data):
+                    self.written.add(en_path)
+        self.pending = remaining
+        return updated, files
+
+    def validate(self):
+        proc = subprocess.run(['node', 'check-translations.cjs'], cwd=ROOT, capture_output=True, text=True)
+        for line in proc.stdout.splitlines():
+            if line.startswith('TOTAL ISSUES'):
+                return line
+        return f"check-translations.cjs exited with {proc.returncode}"
+
+    # ------------------------------------------------------------
+    # Rebuild
+    # ------------------------------------------------------------
+    def rebuild(self, changed):
+        """Run the steps affected by the changed file names and print a timing breakdown."""
+        self.written = set()
+        names = {os.path.basename(p) for p in changed}
+        vocab_changed = any(os.sep + 'vocabulary' + os.sep in p for p in changed)
+        timings = []
+        notes = []
+        start = time.perf_counter()
+        stats = dict(json_output.STATS)
+
+        def timed(label, fn, *args):
+            t0 = time.perf_counter()
+            result = fn(*args)
+            timings.append(f"{label} {(time.perf_counter() - t0) * 1000:.0f}ms")
+            return result
+
+        if self.lexicon_file in names:
+            timed('lexicon', self.load_lexicon)
+
+        touched_levels = set()
+        if self.lexicon_file in names or TRANSLATE_INPUT in names:
+            notes.append(timed('translate', self.translate))
+            touched_levels.add(TRANSLATE_OUTPUT[len('translations-'):-len('.json')])
+
+        for name in sorted(names):
+            main = MAIN_RE.match(name)
+            if main:
+                touched_levels.add(main.group(1))
+        for lvl in sorted(touched_levels):
+            self.load_translations(lvl)
+
+        chunk_levels = sorted({m.group(1) for m in map(CHUNK_RE.match, names) if m})
+        for lvl in chunk_levels:
+            merged = timed(f'merge {lvl}', self.merge, lvl)
+            notes.append(f"{lvl}: {merged} merged")
+
+        if vocab_changed:
+            timed('re-index', self.load_vocabulary)
+
+        if touched_levels or chunk_levels or vocab_changed:
+            timed('master', self.rebuild_master)
+            updated, files = timed('apply', self.apply)
+            notes.append(f"{updated} words updated in {files} files, {len(self.pending)} still Italian")
+            if self.validate_enabled:
+                notes.append(timed('validate', self.validate))
+
+        if timings:
+            notes.append(f"JSON output: {json_output.report(since=stats)}")
+        total = (time.perf_counter() - start) * 1000
+        shown = sorted(names) if len(names) <= 12 else sorted(names)[:12] + [f'... {len(names) - 12} more']
+        print(f"[{time.strftime('%H:%M:%S')}] {', '.join(shown)}")
+        print(f"  {' · '.join(timings) or 'nothing to do'} · total {total:.0f}ms")
+        for note in notes:
+            print(f"  {note}")
+        return self.written
+
+
+def watched_files(lexicon_file):
+    patterns = ['translations-*.json', 'trans-*-*.json', lexicon_file, TRANSLATE_INPUT] + VOCAB_PATTERNS
+    files = set()
+    for pattern in patterns:
+        files.update(glob.glob(os.path.join(ROOT, pattern)))
+    return files
+
+
+def snapshot(files):
+    stamps = {}
+    for path in files:
+        try:
+            stamps[path] = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            pass
+    return stamps
+
+
+def watch(pipeline, interval):
+    stamps = snapshot(watched_files(pipeline.lexicon_file))
+    print(f"Watching {len(stamps)} files (Ctrl+C to stop)")
+    while True:
+        time.sleep(interval)
+        current = snapshot(watched_files(pipeline.lexicon_file))
+        changed = [p for p, mtime in current.items() if stamps.get(p) != mtime]
+        if not changed:
+            continue
+        # Let the editor finish writing before reading the file
+        time.sleep(0.05)
+        try:
+            pipeline.rebuild(changed)
+        except Exception as e:
+            # A broken lexicon or a half-saved file must not stop the watcher
+            print(f"  skipped: {type(e).__name__}: {e}")
+        # Our own writes must not trigger another rebuild
+        stamps = snapshot(watched_files(pipeline.lexicon_file))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--lexicon', default='final_translate.py', help='translation script holding the lexicon')
+    parser.add_argument('--interval', type=float, default=0.2, help='polling interval in seconds')
+    parser.add_argument('--no-validate', action='store_true', help='skip check-translations.cjs')
+    parser.add_argument('--once', action='store_true', help='run every step once and exit')
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    pipeline = Pipeline(args.lexicon, validate=not args.no_validate)
+
+    t0 = time.perf_counter()
+    pipeline.warm_up()
+    print(f"Warm-up: lexicon {args.lexicon}, {len(pipeline.master)} translations, "
+          f"{len(pipeline.en_files)} EN files, {len(pipeline.pending)} words still Italian "
+          f"({(time.perf_counter() - t0) * 1000:.0f}ms)")
+
+    if args.once:
+        pipeline.rebuild(glob.glob(os.path.join(ROOT, 'trans-*-*.json')) + [os.path.join(ROOT, args.lexicon)])
+        return
+
+    try:
+        watch(pipeline, args.interval)
+    except KeyboardInterrupt:
+        print("\nStopped.")
+
+
+if __name__ == "__main__":
+    main()